@@ -2,7 +2,7 @@ from unittest import TestCase
 
 from bib_models import DocID
 
-from ..util import get_primary_docid
+from ..util import construct_bibitem, get_primary_docid
 
 
 class UtilTestcase(TestCase):
@@ -33,3 +33,17 @@ class UtilTestcase(TestCase):
             DocID(id="id3", type="type3", scope="scope"),
         ]
         self.assertIsNone(get_primary_docid(raw_ids))
+
+    def test_construct_bibitem_skip_validation(self):
+        """
+        construct_bibitem should construct invalid data as is
+        and report no errors if skipping validation
+        """
+        data = dict(
+            docid=[dict(id="id", type="type")],
+            date=[dict(type="published", value="not a date")],
+        )
+        bibitem, errors = construct_bibitem(data, skip_validation=True)
+        self.assertIsNone(errors)
+        self.assertEqual(bibitem.docid, [dict(id="id", type="type")])
+        self.assertEqual(bibitem.date[0]["value"], "not a date")  # type: ignore
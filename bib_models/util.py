@@ -1,4 +1,4 @@
-from typing import cast, Optional, List, Tuple, Dict, Any
+from typing import cast, Optional, List, Set, Tuple, Dict, Any
 import logging
 
 from pydantic import ValidationError
@@ -11,7 +11,11 @@ from relaton.models.bibdata import BibliographicItem, DocID
 log = logging.getLogger(__name__)
 
 
-def construct_bibitem(data: Dict[str, Any], strict: bool = True) -> Tuple[
+def construct_bibitem(
+    data: Dict[str, Any],
+    strict: bool = True,
+    skip_validation: bool = False,
+) -> Tuple[
     BibliographicItem,
     Optional[List[ValidationErrorDict]],
 ]:
@@ -32,6 +36,10 @@ def construct_bibitem(data: Dict[str, Any], strict: bool = True) -> Tuple[
     :param bool strict:
         See :ref:`strict-validation`.
 
+    :param bool skip_validation:
+        If ``True``, constructs the item from normalized data as is,
+        without validation. Errors are then always None.
+
     :returns:
         a 2-tuple ``(bibliographic item, validation errors)``,
         where errors may be None or a list of Pydantic’s ErrorDicts.
@@ -46,7 +54,9 @@ def construct_bibitem(data: Dict[str, Any], strict: bool = True) -> Tuple[
     except Exception:
         pass
 
-    if strict:
+    if skip_validation:
+        bibitem = BibliographicItem.construct(**data)
+    elif strict:
         bibitem = BibliographicItem(**data)
     else:
         try:
@@ -71,30 +81,29 @@ def get_primary_docid(raw_ids: List[DocID]) -> Optional[DocID]:
     :rtype: relaton.models.bibdata.DocID or None
     """
 
-    primary_docids: List[DocID] = [
-        docid for docid in raw_ids
-        if all([
-            docid.primary is True,
-            # As a further sanity check, require id and type, but no scope:
-            docid.id is not None,
-            docid.type is not None,
-            docid.scope is None,
-        ])
-    ]
-
-    deduped = set([frozenset([id.id, id.type]) for id in primary_docids])
+    first: Optional[DocID] = None
+    deduped: Set[Tuple[str, str]] = set()
+    count = 0
+
+    for docid in raw_ids:
+        # As a further sanity check, require id and type, but no scope:
+        if (docid.primary is True
+                and docid.id is not None
+                and docid.type is not None
+                and docid.scope is None):
+            if first is None:
+                first = docid
+            deduped.add((docid.id, docid.type))
+            count += 1
 
     if len(deduped) != 1:
         log.warn(
             "get_primary_docid(): unexpected number of primary docids "
             "found for %s: %s",
             raw_ids,
-            len(primary_docids))
+            count)
 
-    try:
-        return primary_docids[0]
-    except IndexError:
-        return None
+    return first
 
 
 def normalize_relaxed(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -374,6 +374,10 @@ DEFAULT_CACHE_SECONDS = 21600
 SEARCH_CACHE_SECONDS = 3600
 """How long to cache search results for."""
 
+CROSSREF_CACHE_SECONDS = 2592000
+"""How long to cache Crossref responses for.
+DOI metadata rarely changes, so this is much longer than the default."""
+
 
 # BibXML-specific
 # ===============
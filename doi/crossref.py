@@ -1,20 +1,16 @@
 """Responsible for Crossref interaction."""
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Dict, Any, Optional, Tuple
+import time
 
 from crossref.restful import Works, Etiquette
 from django.conf import settings
 from django.core.cache import cache
-from relaton.models import Date
-from relaton.models.bibdata import Contributor, Role, DocID
-from relaton.models.bibitemlocality import Locality, LocalityStack
-from relaton.models.links import Link
-from relaton.models.orgs import Organization
-from relaton.models.people import FullName, GivenName, Forename
-from relaton.models.people import Person, PersonAffiliation
-from relaton.models.strings import GenericStringValue, Title
+from relaton.models.bibdata import DocID
 
 from bib_models import construct_bibitem
-from bibxml.settings import DEFAULT_CACHE_SECONDS
+from bibxml.settings import CROSSREF_CACHE_SECONDS
 from common.util import as_list
 from main.exceptions import RefNotFoundError
 from main.types import ExternalBibliographicItem, ExternalSourceMeta
@@ -29,6 +25,20 @@ etiquette = Etiquette(
 
 works = Works(etiquette=etiquette)
 
+BATCH_SIZE = 40
+"""How many DOIs to request from Crossref in one filter query.
+Kept small so that the request URI stays well within length limits."""
+
+MAX_CONCURRENT_BATCHES = 4
+"""How many batches of DOIs to request from Crossref at the same time."""
+
+MEMO_SECONDS = 300
+"""How long a Crossref response taken from the shared cache
+is also kept in process memory (see :func:`get_cached_resp`)."""
+
+MEMO_SIZE = 1024
+"""How many Crossref responses to keep in process memory at most."""
+
 ACCEPTED_DATE_TYPES = ["published", "accessed", "created", "implemented", "obsoleted",
                        "confirmed", "updated", "issued", "transmitted", "copied", "unchanged",
                        "circulated", "adapted", "vote-started", "vote-ended", "announced"]
@@ -39,101 +49,291 @@ def get_bibitem(docid: DocID, strict: bool = True) \
     """Retrieves DOI information from Crossref and deserializes it
     into a :class:`main.types.ExternalBibliographicItem` instance.
 
+    Thin wrapper around :func:`get_bibitems` for a single DOI.
+
     :param str docid: DOI identifier
     :param bool strict: see :ref:`strict-validation`
-    :returns None: if no match was returned by Crossref
-    :rtype: None or main.types.ExternalBibliographicItem
+    :rtype: main.types.ExternalBibliographicItem
     :raises ValueError: wrong docid.type (not DOI)
     :raises main.exceptions.RefNotFoundError: no matching item returned
     :raises pydantic.ValidationError:
         strict is True and Relaton data failed to validate
     """
 
-    if docid.type != 'DOI':
-        raise ValueError(
-            "DOI source requires DOI docid.type",
-            repr(docid))
-
-    resp = cache.get(f'DOI_{docid.id}')
-    if not resp:
-        resp = works.doi(docid.id)
-        if not resp:
-            raise RefNotFoundError("There was a problem retrieving DOI data. "
-                                   "This can be caused by an invalid id or by "
-                                   "Crossref (the service we retrieve DOI data "
-                                   "from) being unavailable at the moment. Try again later!")
-        cache.set(f'DOI_{docid.id}', resp, DEFAULT_CACHE_SECONDS)
-
-    docids: List[DocID] = [
-        DocID(type='DOI', id=resp['DOI']),
-
-        *(DocID(type='ISSN', id=issn)
-          for issn in resp.get('ISSN', [])),
-
-        *(DocID(type='ISBN', id=ISBN_TMPL.format(*isbn))
-          for isbn in resp.get('ISBN', [])
-          if len(isbn) == 13),
-    ]
+    items = get_bibitems([docid], strict=strict)
+    try:
+        return items[docid.id.lower()]
+    except KeyError:
+        raise RefNotFoundError("There was a problem retrieving DOI data. "
+                               "This can be caused by an invalid id or by "
+                               "Crossref (the service we retrieve DOI data "
+                               "from) being unavailable at the moment. Try again later!")
+
+
+def get_bibitems(docids: List[DocID], strict: bool = True) \
+        -> Dict[str, ExternalBibliographicItem]:
+    """Retrieves information about multiple DOIs from Crossref
+    and deserializes each into
+    a :class:`main.types.ExternalBibliographicItem` instance.
+
+    DOIs not found in cache (see :func:`get_cached_resp`)
+    are requested from Crossref
+    using a ``doi`` filter query, :data:`BATCH_SIZE` DOIs per request,
+    instead of one request per DOI.
+    DOIs containing a comma are requested one by one
+    (see :func:`fetch_work`).
+
+    If there is more than one batch,
+    up to :data:`MAX_CONCURRENT_BATCHES` are requested concurrently
+    from worker threads. Each batch query is a separate ``Works`` instance
+    (see :func:`fetch_works`), so no client or rate-limit state
+    is shared between threads.
+
+    .. note:: Nothing in the service currently reaches the concurrent
+              path: the only caller, :func:`get_bibitem`,
+              requests one DOI at a time.
+
+    :param docids: DOI identifiers
+    :param bool strict: see :ref:`strict-validation`
+    :returns:
+        a dict mapping lowercased DOI to retrieved item.
+        DOIs for which Crossref returned no match are omitted.
+    :raises ValueError: wrong docid.type (not DOI)
+    :raises RuntimeError: unexpected response from Crossref
+    :raises pydantic.ValidationError:
+        strict is True and Relaton data failed to validate
+    """
 
-    contributors: List[Contributor] = [
-        *(to_contributor('author', author)
-          for author in resp.get('author', [])),
-        *(to_contributor('editor', editor)
-          for editor in resp.get('editor', [])),
-        *(to_contributor('translator', translator)
-          for translator in resp.get('translator', [])),
-        *(to_contributor('chair', chair)
-          for chair in resp.get('chair', [])),
+    resps: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+
+    for docid in docids:
+        if docid.type != 'DOI':
+            raise ValueError(
+                "DOI source requires DOI docid.type",
+                repr(docid))
+        doi = docid.id.lower()
+        if doi in resps or doi in missing:
+            continue
+        try:
+            resps[doi] = get_cached_resp(doi)
+        except KeyError:
+            missing.append(doi)
+
+    # Commas separate filters, so such DOIs can’t go into a filter query
+    unfilterable = [doi for doi in missing if ',' in doi]
+    filterable = [doi for doi in missing if ',' not in doi]
+
+    batches = [
+        filterable[idx:idx + BATCH_SIZE]
+        for idx in range(0, len(filterable), BATCH_SIZE)
     ]
-    if publisher := resp.get('publisher', '').strip():
-        contributors.append(Contributor(
-            role=[Role(type='publisher')],
-            organization=Organization(
-                name=GenericStringValue(content=publisher),
+    if len(batches) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(batches), MAX_CONCURRENT_BATCHES),
+        ) as executor:
+            fetched = list(executor.map(fetch_works, batches))
+    else:
+        fetched = [fetch_works(batch) for batch in batches]
+    fetched.extend(fetch_work(doi) for doi in unfilterable)
+
+    for batch_resps in fetched:
+        for resp in batch_resps:
+            doi = resp['DOI'].lower()
+            resps[doi] = resp
+            cache.set(f'DOI_{doi}', resp, CROSSREF_CACHE_SECONDS)
+
+    return {
+        doi: to_external_bibitem(resp, strict)
+        for doi, resp in resps.items()
+    }
+
+
+def fetch_works(dois: List[str]) -> List[Dict[str, Any]]:
+    """Requests works matching given DOIs from Crossref
+    using a single ``doi`` filter query.
+
+    Makes exactly one request: a ``doi`` filter cannot match more works
+    than DOIs given, so a single page of ``len(dois)`` rows suffices.
+    (Iterating the query instead would follow Crossref’s cursor
+    and always request an extra, empty page.)
+
+    If Crossref rejects the query as invalid (HTTP 400),
+    none of the DOIs are considered found.
+
+    :param dois: DOIs without commas, no more than :data:`BATCH_SIZE`
+    :returns: a list of work structures from Crossref response
+    :raises RuntimeError: unexpected response from Crossref
+    """
+    query = works
+    for doi in dois:
+        query = query.filter(doi=doi)
+    resp = query.do_http_request(
+        'get',
+        query.request_url,
+        data=dict(query.request_params, rows=len(dois)),
+        custom_header=query.custom_header,
+        timeout=query.timeout,
+    )
+    if resp.status_code in (400, 404):
+        return []
+    if resp.status_code != 200:
+        raise RuntimeError(
+            "Unexpected Crossref response status",
+            resp.status_code)
+
+    body = resp.json()
+    message = body.get('message') if isinstance(body, dict) else None
+    items = message.get('items') if isinstance(message, dict) else None
+    if not isinstance(items, list):
+        raise RuntimeError("Unexpected Crossref response structure")
+    return items
+
+
+def fetch_work(doi: str) -> List[Dict[str, Any]]:
+    """Requests a single work from Crossref by DOI.
+
+    Used for DOIs that cannot be put in a ``doi`` filter query,
+    namely those containing a comma.
+
+    :param str doi: DOI
+    :returns: a list with the work, or an empty list if not found
+              or rejected by Crossref as invalid
+    :raises RuntimeError: unexpected response from Crossref
+    """
+    resp = works.doi(doi, only_message=False)
+    if resp is None:
+        return []
+    if not isinstance(resp, dict):
+        raise RuntimeError("Unexpected Crossref response structure")
+    if resp.get('status') == 'failed':
+        return []
+    if not isinstance(resp.get('message'), dict):
+        raise RuntimeError("Unexpected Crossref response structure")
+    return [resp['message']]
+
+
+_memo: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_memo_lock = Lock()
+
+
+def get_cached_resp(doi: str) -> Dict[str, Any]:
+    """Returns Crossref work structure for given DOI
+    from the shared cache.
+
+    Hits are additionally memoized in process memory
+    for :data:`MEMO_SECONDS`, up to :data:`MEMO_SIZE` DOIs,
+    keeping only :data:`MEMOIZED_FIELDS`. Misses are not memoized.
+
+    :param str doi: lowercased DOI
+    :raises KeyError: DOI is not cached
+    """
+    now = time.monotonic()
+    with _memo_lock:
+        if (memoized := _memo.get(doi)) and memoized[0] > now:
+            return memoized[1]
+
+    if not (resp := cache.get(f'DOI_{doi}')):
+        raise KeyError(doi)
+    resp = {
+        field: resp[field]
+        for field in MEMOIZED_FIELDS
+        if field in resp
+    }
+
+    with _memo_lock:
+        _memo.pop(doi, None)
+        # All entries live equally long, so the oldest expire first
+        for key in list(_memo):
+            if len(_memo) < MEMO_SIZE and _memo[key][0] > now:
+                break
+            del _memo[key]
+        _memo[doi] = (now + MEMO_SECONDS, resp)
+    return resp
+
+
+def clear_memo():
+    """Drops Crossref responses memoized by :func:`get_cached_resp`."""
+    with _memo_lock:
+        _memo.clear()
+
+
+def to_external_bibitem(resp: Dict[str, Any], strict: bool = True) \
+        -> ExternalBibliographicItem:
+    """Deserializes a work object returned by Crossref
+    into a :class:`main.types.ExternalBibliographicItem` instance.
+
+    Bibliographic data is assembled as plain dicts
+    and validated once, by :func:`bib_models.util.construct_bibitem`.
+    (Pydantic dataclass instances nested in a model are validated again
+    by the model, so building them here would double the work.)
+
+    :param dict resp: work structure from Crossref response
+    :param bool strict: see :ref:`strict-validation`
+    :rtype: main.types.ExternalBibliographicItem
+    :raises pydantic.ValidationError:
+        strict is True and Relaton data failed to validate
+    """
+
+    docids: List[Dict[str, Any]] = [dict(type='DOI', id=resp['DOI'])]
+    for issn in resp.get('ISSN') or ():
+        docids.append(dict(type='ISSN', id=issn))
+    for isbn in resp.get('ISBN') or ():
+        if len(isbn) == 13:
+            docids.append(dict(type='ISBN', id=format_isbn(isbn)))
+
+    contributors: List[Dict[str, Any]] = []
+    for role in CONTRIBUTOR_ROLES:
+        for person in resp.get(role) or ():
+            contributors.append(to_contributor(role, person))
+    if publisher := (resp.get('publisher') or '').strip():
+        contributors.append(dict(
+            role=[dict(type='publisher')],
+            organization=dict(
+                name=dict(content=publisher),
             ),
         ))
 
-    titles: List[Title] = [
-        *(Title(content=title, type=None)
-          for title in resp['title']),
-
-        *(Title(content=title, type=tid)
-          for tid in ALT_TITLES
-          for title in as_list(resp.get(tid, []))
-          if tid in resp),
+    titles: List[Dict[str, Any]] = [
+        dict(content=title, type=None)
+        for title in resp.get('title') or ()
     ]
+    for tid in ALT_TITLES:
+        if tid in resp:
+            titles.extend(
+                dict(content=title, type=tid)
+                for title in as_list(resp[tid]))
 
     # LocalityStack
-    container_title = resp.get('container-title')
-    extent: Optional[LocalityStack]
-    if container_title:
-        localities: List[Locality] = [
-            Locality(
+    extent: Optional[Dict[str, Any]]
+    if container_title := resp.get('container-title'):
+        localities: List[Dict[str, Any]] = [
+            dict(
                 type='container-title',
                 reference_from=container_title[0],
             ),
         ]
         if volume := resp.get('volume', None):
-            localities.append(Locality(type='volume', reference_from=volume))
-        if issue := resp.get('journal-issue', {}).get('issue', None):
-            localities.append(Locality(type='issue', reference_from=issue))
+            localities.append(dict(type='volume', reference_from=volume))
+        if (journal_issue := resp.get('journal-issue')) \
+                and (issue := journal_issue.get('issue')):
+            localities.append(dict(type='issue', reference_from=issue))
         if page := resp.get('page', None):
-            localities.append(Locality(type='page', reference_from=page))
+            localities.append(dict(type='page', reference_from=page))
 
-        extent = LocalityStack(locality=localities)
+        extent = dict(locality=localities)
     else:
         extent = None
 
     dates = []
     for date_type in ACCEPTED_DATE_TYPES:
-        if resp.get(date_type):
-            date_parts = resp.get(date_type).get('date-parts')
-            for _part in date_parts:
-                if isinstance(_part[0], int):
+        if date_info := resp.get(date_type):
+            for _part in date_info.get('date-parts') or ():
+                if _part and isinstance(_part[0], int):
                     date = "%04d" % _part[0]
                     for _i in _part[1:]:
                         date += "-%02d" % _i
-                    dates.append(Date(type=date_type, value=date))
+                    dates.append(dict(type=date_type, value=date))
 
     data = dict(
         # The following are not captured:
@@ -152,7 +352,7 @@ def get_bibitem(docid: DocID, strict: bool = True) \
         docid=docids,
         language=resp.get('language', None),
         title=titles,
-        link=[Link(
+        link=[dict(
             content=resp['URL'],
         )],
         abstract=[{
@@ -178,34 +378,36 @@ def get_bibitem(docid: DocID, strict: bool = True) \
 
 
 def to_contributor(role: str, crossref_author: Dict[str, Any]) \
-        -> Contributor:
-    """Constructs a contributor from the author object
-    returned by Crossref.
+        -> Dict[str, Any]:
+    """Converts the author object returned by Crossref
+    into a dict representing a contributor.
 
     :param str role: contributor’s role
     :param dict crossref_author: structure from Crossref response
-    :rtype: relaton.models.bibdata.Contributor
+    :returns: a dict conforming
+              to :class:`relaton.models.bibdata.Contributor`
+    :rtype: dict
     """
-    return Contributor(
-        role=[Role(type=role)],
-        person=Person(
-            affiliation=[PersonAffiliation(
-                organization=Organization(
+    return dict(
+        role=[dict(type=role)],
+        person=dict(
+            affiliation=[dict(
+                organization=dict(
                     # NOTE: DOI seems to supply abbreviation as name.
                     name=[aff['name']],
                     contact=[],
                     url=None,
                     abbreviation=None,
                 ),
-            ) for aff in crossref_author['affiliation']],
-            name=FullName(
-                surname=GenericStringValue(
+            ) for aff in crossref_author.get('affiliation') or ()],
+            name=dict(
+                surname=dict(
                     content=crossref_author['family'],
                 ) if 'family' in crossref_author else None,
-                completename=GenericStringValue(
+                completename=dict(
                     content=crossref_author['name'],
                 ) if 'name' in crossref_author else None,
-                given=GivenName(forename=[Forename(
+                given=dict(forename=[dict(
                     content=crossref_author['given'],
                 )] if 'given' in crossref_author else [])
             ),
@@ -213,9 +415,21 @@ def to_contributor(role: str, crossref_author: Dict[str, Any]) \
     )
 
 
-ISBN_TMPL = '{0}{1}{2}-{3}-{4}{5}{6}{7}-{8}{9}{10}{11}-{12}'
-"""Crossref returns ISBNs without dashes.
-This format string conforms it to Relaton, which uses dashes."""
+def format_isbn(isbn: str) -> str:
+    """Crossref returns ISBNs without dashes.
+    This conforms a 13-digit ISBN to Relaton, which uses dashes.
+    """
+    return f'{isbn[:3]}-{isbn[3]}-{isbn[4:8]}-{isbn[8:12]}-{isbn[12]}'
+
+
+CONTRIBUTOR_ROLES = (
+    'author',
+    'editor',
+    'translator',
+    'chair',
+)
+"""Crossref keys listing people,
+which are also used as their contributor roles in Relaton."""
 
 ALT_TITLES = [
     'subtitle',
@@ -225,3 +439,22 @@ ALT_TITLES = [
     'short-container-title',
     'group-title',
 ]
+
+
+MEMOIZED_FIELDS = (
+    'DOI',
+    'ISSN',
+    'ISBN',
+    'URL',
+    'abstract',
+    'language',
+    'publisher',
+    'title',
+    'volume',
+    'journal-issue',
+    'page',
+    *CONTRIBUTOR_ROLES,
+    *ALT_TITLES,
+    *ACCEPTED_DATE_TYPES,
+)
+"""Crossref work keys read by :func:`to_external_bibitem`."""
@@ -0,0 +1,202 @@
+from typing import Any, Dict, Optional, Set
+import threading
+import time
+from unittest.mock import Mock, patch
+from urllib.parse import unquote
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from bib_models import DocID
+from doi.crossref import BATCH_SIZE, get_bibitem, get_bibitems
+from doi.crossref import MEMO_SECONDS, clear_memo, get_cached_resp
+from main.exceptions import RefNotFoundError
+from main.types import ExternalBibliographicItem
+
+
+def work(doi: str) -> Dict[str, Any]:
+    return {
+        'DOI': doi,
+        'URL': f'https://doi.org/{doi}',
+        'title': [f'Title of {doi}'],
+    }
+
+
+def response(status_code: int, body: Optional[Any] = None) -> Mock:
+    return Mock(status_code=status_code, headers={}, json=Mock(
+        return_value=body))
+
+
+@override_settings(CACHES={'default': {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+}})
+@patch('crossref.restful.sleep', Mock())
+class CrossrefTestCase(SimpleTestCase):
+    """
+    Test cases for crossref.py, with Crossref API responses mocked
+    """
+
+    def setUp(self):
+        cache.clear()
+        clear_memo()
+        self.known_dois: Set[str] = set()
+        patcher = patch('crossref.restful.requests.get')
+        self.requests_get = patcher.start()
+        self.requests_get.side_effect = self.crossref_transport
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        clear_memo()
+
+    def crossref_transport(self, url: str, params=None, **kwargs) -> Mock:
+        """Mimics Crossref’s /works/<doi> and /works?filter= endpoints."""
+        if '/works/' in url:
+            doi = unquote(url.split('/works/', 1)[1])
+            if doi in self.known_dois:
+                return response(200, {'status': 'ok', 'message': work(doi)})
+            return response(404)
+
+        dois = [
+            fltr.split(':', 1)[1]
+            for fltr in params['filter'].split(',')
+        ]
+        return response(200, {'status': 'ok', 'message': {
+            'items': [work(doi) for doi in dois if doi in self.known_dois],
+            'next-cursor': 'cursor',
+        }})
+
+    def requested_dois(self, call) -> Set[str]:
+        return set(
+            fltr.split(':', 1)[1]
+            for fltr in call.kwargs['params']['filter'].split(',')
+        )
+
+    def test_get_bibitem_single_request(self):
+        self.known_dois = {'10.1000/abc'}
+        item = get_bibitem(DocID(type='DOI', id='10.1000/abc'))
+        self.assertIsInstance(item, ExternalBibliographicItem)
+        self.assertEqual(item.bibitem.docid[0].id, '10.1000/abc')
+        self.assertEqual(self.requests_get.call_count, 1)
+        params = self.requests_get.call_args.kwargs['params']
+        self.assertEqual(params['rows'], 1)
+        self.assertNotIn('cursor', params)
+
+    def test_get_bibitem_cached(self):
+        self.known_dois = {'10.1000/abc'}
+        get_bibitem(DocID(type='DOI', id='10.1000/abc'))
+        get_bibitem(DocID(type='DOI', id='10.1000/ABC'))
+        self.assertEqual(self.requests_get.call_count, 1)
+
+    def test_get_cached_resp_memo_expires(self):
+        self.known_dois = {'10.1000/abc'}
+        get_bibitem(DocID(type='DOI', id='10.1000/abc'))
+        get_cached_resp('10.1000/abc')
+        cache.clear()
+        self.assertEqual(get_cached_resp('10.1000/abc')['DOI'], '10.1000/abc')
+
+        expired = time.monotonic() + MEMO_SECONDS + 1
+        with patch('doi.crossref.time.monotonic', Mock(return_value=expired)):
+            with self.assertRaises(KeyError):
+                get_cached_resp('10.1000/abc')
+
+    def test_get_cached_resp_memoizes_used_fields(self):
+        cache.set('DOI_10.1000/abc', dict(
+            work('10.1000/abc'),
+            reference=[{'key': 'ref1'}],
+        ))
+        resp = get_cached_resp('10.1000/abc')
+        self.assertEqual(resp, work('10.1000/abc'))
+
+    def test_get_bibitems_chunked(self):
+        dois = [f'10.1000/{i}' for i in range(BATCH_SIZE + 1)]
+        self.known_dois = set(dois)
+        items = get_bibitems([DocID(type='DOI', id=doi) for doi in dois])
+        self.assertEqual(set(items.keys()), set(dois))
+        self.assertEqual(self.requests_get.call_count, 2)
+        requested = [
+            self.requested_dois(call)
+            for call in self.requests_get.call_args_list
+        ]
+        self.assertTrue(all(len(batch) <= BATCH_SIZE for batch in requested))
+        self.assertEqual(set().union(*requested), set(dois))
+
+    def test_get_bibitems_concurrent_batches(self):
+        """
+        Multiple batches should be requested from worker threads
+        and their results combined
+        """
+        dois = [f'10.1000/{i}' for i in range(BATCH_SIZE * 3)]
+        self.known_dois = set(dois)
+        request_threads = set()
+
+        def transport(url, params=None, **kwargs):
+            request_threads.add(threading.get_ident())
+            return self.crossref_transport(url, params, **kwargs)
+
+        self.requests_get.side_effect = transport
+        items = get_bibitems([DocID(type='DOI', id=doi) for doi in dois])
+        self.assertEqual(set(items.keys()), set(dois))
+        self.assertEqual(self.requests_get.call_count, 3)
+        self.assertNotIn(threading.get_ident(), request_threads)
+
+    def test_get_bibitems_deduped(self):
+        self.known_dois = {'10.1000/abc', '10.1000/def'}
+        items = get_bibitems([
+            DocID(type='DOI', id='10.1000/ABC'),
+            DocID(type='DOI', id='10.1000/abc'),
+            DocID(type='DOI', id='10.1000/def'),
+            DocID(type='DOI', id='10.1000/def'),
+        ])
+        self.assertEqual(set(items.keys()), {'10.1000/abc', '10.1000/def'})
+        self.assertEqual(self.requests_get.call_count, 1)
+        self.assertEqual(
+            self.requests_get.call_args.kwargs['params']['filter'],
+            'doi:10.1000/abc,doi:10.1000/def')
+
+    def test_get_bibitems_omits_missing(self):
+        self.known_dois = {'10.1000/abc'}
+        items = get_bibitems([
+            DocID(type='DOI', id='10.1000/abc'),
+            DocID(type='DOI', id='10.1000/missing'),
+        ])
+        self.assertEqual(list(items.keys()), ['10.1000/abc'])
+
+    def test_fail_get_bibitem_if_missing(self):
+        with self.assertRaises(RefNotFoundError):
+            get_bibitem(DocID(type='DOI', id='10.1000/missing'))
+
+    def test_fail_get_bibitem_if_not_doi(self):
+        with self.assertRaises(ValueError):
+            get_bibitem(DocID(type='ISBN', id='978-1-2345-6789-7'))
+        self.assertEqual(self.requests_get.call_count, 0)
+
+    def test_get_bibitem_with_comma(self):
+        """
+        DOIs containing a comma can’t be used in a filter query
+        and should be requested individually
+        """
+        self.known_dois = {'10.1000/a,b'}
+        item = get_bibitem(DocID(type='DOI', id='10.1000/a,b'))
+        self.assertEqual(item.bibitem.docid[0].id, '10.1000/a,b')
+        self.assertEqual(self.requests_get.call_count, 1)
+        self.assertIn('/works/', self.requests_get.call_args.args[0])
+
+    def test_fail_get_bibitem_if_rejected(self):
+        """
+        Crossref responds to invalid input with 400 and a list of errors
+        as message, which should be treated as not found
+        """
+        self.requests_get.side_effect = lambda *args, **kwargs: response(
+            400,
+            {'status': 'failed', 'message': [{'type': 'validation-failure'}]})
+        with self.assertRaises(RefNotFoundError):
+            get_bibitem(DocID(type='DOI', id='10.1000/abc'))
+        with self.assertRaises(RefNotFoundError):
+            get_bibitem(DocID(type='DOI', id='10.1000/a,b'))
+
+    def test_fail_get_bibitem_if_server_error(self):
+        self.requests_get.side_effect = lambda *args, **kwargs: response(
+            500,
+            {'status': 'error'})
+        with self.assertRaises(RuntimeError):
+            get_bibitem(DocID(type='DOI', id='10.1000/abc'))
@@ -652,6 +652,7 @@ DocIDTuple = Tuple[Tuple[str, str], Tuple[str, str]]
 
 def build_search_results(
     refs: QuerySet[RefData],
+    trusted: bool = False,
 ) -> List[FoundItem]:
     """Given a :class:`django.db.models.query.QuerySet`
     of :class:`~.models.RefData` entries, builds a list
@@ -662,6 +663,8 @@ def build_search_results(
     Takes care of merging search headline annotations, if any.
 
     :param django.db.models.query.QuerySet[RefData] refs: found refs
+    :param bool trusted:
+        skip validation, see :func:`~.query_utils.compose_bibitem()`
     :rtype: List[FoundItem]
     """
 
@@ -703,7 +706,12 @@ def build_search_results(
             ])
             found_item, valid = typeCast(
                 Tuple[FoundItem, bool],
-                compose_bibitem(refs_to_merge, _docid, strict=False))
+                compose_bibitem(
+                    refs_to_merge,
+                    _docid,
+                    strict=False,
+                    trusted=trusted,
+                ))
             found_item.headline = ' … '.join(headlines)
             results.append(found_item)
 
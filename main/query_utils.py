@@ -2,6 +2,7 @@
 
 from typing import Callable, Union, Sequence, Dict, Any, Optional, Tuple
 import logging
+import re
 
 from django.db.models.query import QuerySet
 from django.db.utils import ProgrammingError, DataError
@@ -26,10 +27,21 @@ __all__ = (
 log = logging.getLogger(__name__)
 
 
+BENIGN_USER_INPUT_ERROR_RE = re.compile(
+    r'invalid regular expression'
+    r'|(?:syntax error|unexpected end of quoted string).*jsonpath input'
+    r'|jsonpath input.*(?:syntax error|unexpected end of quoted string)',
+    re.DOTALL,
+)
+"""Matches error representations
+considered benign by :func:`is_benign_user_input_error`."""
+
+
 def compose_bibitem(
     refs: Sequence[RefData],
     primary_id: Optional[str] = None,
     strict: bool = True,
+    trusted: bool = False,
 ) -> Tuple[CompositeSourcedBibliographicItem, bool]:
     """
     Converts multiple physical ``RefData`` instances,
@@ -52,9 +64,19 @@ def compose_bibitem(
 
     :param bool strict: see :ref:`strict-validation`
 
+    :param bool trusted:
+        If ``True`` and ``strict`` is ``False``, skips validation
+        of per-source and composite items entirely,
+        constructing them from normalized data as is.
+        Suitable for read-only listings that are fine with
+        possibly unvalidated data; ``is_valid`` is then always ``False``,
+        since nothing was checked.
+
     :returns: 2-tuple (main.types.CompositeSourcedBibliographicItem, is_valid)
     """
 
+    skip_validation = trusted and not strict
+
     base: Dict[str, Any] = {}
     # Merged bibitems
 
@@ -68,7 +90,11 @@ def compose_bibitem(
         obj = get_indexed_object_meta(ref.dataset, ref.ref)
         sourced_id = f'{ref.ref}@{source.id}'
 
-        bibitem, validation_errors = construct_bibitem(ref.body, strict)
+        bibitem, validation_errors = construct_bibitem(
+            ref.body,
+            strict,
+            skip_validation=skip_validation,
+        )
         # NOTE: construct_bibitem() does loose YAML normalization
         # on ``ref.body`` IN-PLACE as a side-effect,
         # so we must call it first or CompositeSourcedBibliographicItem
@@ -92,7 +118,12 @@ def compose_bibitem(
         'primary_docid': primary_id,
     }
 
-    if not strict and validation_errors_encountered:
+    if skip_validation:
+        return (
+            CompositeSourcedBibliographicItem.construct(**composite),
+            False,
+        )
+    elif not strict and validation_errors_encountered:
         log.error(
             "Failed to validate composite sourced bibliographic item "
             "with primary docid %s "
@@ -164,9 +195,4 @@ def is_benign_user_input_error(exc: Union[ProgrammingError, DataError]) \
     see e.g. :func:`main.query.search_refs_relaton_field`.
     """
 
-    err = repr(exc)
-    return any((
-        "invalid regular expression" in err,
-        "syntax error" in err and "jsonpath input" in err,
-        "unexpected end of quoted string" in err and "jsonpath input" in err,
-    ))
+    return BENIGN_USER_INPUT_ERROR_RE.search(repr(exc)) is not None
@@ -133,6 +133,13 @@ class BaseCitationSearchView(BaseListView):
     ``query_format`` and ``got_results``.
     """
 
+    trust_indexed_data = False
+    """Whether to skip validation when building found items.
+    Only suitable for views that can render unvalidated data.
+
+    .. seealso:: ``trusted`` in :func:`main.query_utils.compose_bibitem()`
+    """
+
     def get(self, request, *args, **kwargs):
         self.is_gui = hasattr(self, 'template_name')
 
@@ -208,13 +215,14 @@ class BaseCitationSearchView(BaseListView):
 
         The actual query is delegated to :meth:`dispatch_handle_query`,
         unless cached results are present for the exact combination
-        of :attr:`query`, :attr:`query_format`, :attr:`show_all_by_default`
-        and :attr:`limit`.
+        of :attr:`query`, :attr:`query_format`, :attr:`show_all_by_default`,
+        :attr:`trust_indexed_data` and :attr:`limit`.
         """
 
         if self.query is not None and self.query_format is not None:
             result_getter = (lambda: build_search_results(
-                self.dispatch_handle_query(self.query)))
+                self.dispatch_handle_query(self.query),
+                trusted=self.trust_indexed_data))
 
             if self.request.GET.get('bypass_cache'):
                 return result_getter()
@@ -225,6 +233,7 @@ class BaseCitationSearchView(BaseListView):
                         'query_format': self.query_format,
                         'limit': self.limit_to,
                         'show_all': self.show_all_by_default,
+                        'trusted': self.trust_indexed_data,
                     }),
                     result_getter,
                     self.result_cache_seconds)
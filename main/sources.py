@@ -13,6 +13,7 @@ under ``/data/`` directory under repository root
 .. seealso:: :rfp:req:`3`
 """
 from typing import Tuple, List, Dict, Any, cast
+from functools import lru_cache
 import glob
 from os import path
 import datetime
@@ -92,9 +93,13 @@ get_github_web_issues = (
 )
 
 
+@lru_cache(maxsize=256)
 def get_source_meta(dataset_id: str) -> IndexedSourceMeta:
     """Should be used on ``dataset_id``
-    that represents an ietf-ribose relaton-data-* repo."""
+    that represents an ietf-ribose relaton-data-* repo.
+
+    Memoized, since it only depends on settings.
+    """
 
     repo_home, _ = locate_relaton_source_repo(dataset_id)
     repo_name = repo_home.split('/')[-1]
@@ -116,6 +121,7 @@ def get_indexed_object_meta(dataset_id: str, ref: str) -> IndexedObject:
     )
 
 
+@lru_cache(maxsize=256)
 def locate_relaton_source_repo(dataset_id: str) -> Tuple[str, str]:
     """
     Given a Relaton dataset ID, returns Git repository information
@@ -127,6 +133,8 @@ def locate_relaton_source_repo(dataset_id: str) -> Tuple[str, str]:
                    ensuring that settings reference correct repositories
                    is considered a responsibility of operations engineers.
 
+    Memoized, since it only depends on settings.
+
     :param dataset_id: dataset ID as string
     :returns: tuple (repo_url, repo_branch)
     """
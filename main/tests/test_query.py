@@ -1,11 +1,13 @@
 import json
 import re
-from typing import List, Any
+from typing import List, Any, Dict, cast as typeCast
 from unittest import TestCase
 
 from django.core.management import call_command
 from django.db.models import QuerySet, Q
+from relaton.models.strings import Title
 
+from bib_models import DocID
 from main.exceptions import RefNotFoundError
 from main.models import RefData
 from main.query import (
@@ -159,6 +161,70 @@ class QueryTestCase(TestCase):
         self.assertIsInstance(found_items, list)
         self.assertGreater(len(found_items), 0)
 
+    def test_build_search_results_trusted(self):
+        """
+        Test that build_search_results skipping validation
+        constructs items as is, but with the same content
+        as validated items.
+        """
+        docids = self._get_list_of_docids_for_dataset_from_fixture("misc")
+        docid = next(docid["id"] for docid in docids if docid.get("scope") == "anchor")
+
+        refs = search_refs_relaton_field(
+            {
+                "docid[*]": '@.id == "%s"' % re.escape(docid),
+            },
+            limit=10,
+            exact=True,
+        )
+
+        found_items = {
+            item.primary_docid: item
+            for item in build_search_results(refs)
+        }
+        trusted_items = {
+            item.primary_docid: item
+            for item in build_search_results(refs.all(), trusted=True)
+        }
+        self.assertGreater(len(trusted_items), 0)
+        self.assertEqual(trusted_items.keys(), found_items.keys())
+
+        for primary_docid, trusted in trusted_items.items():
+            found = found_items[primary_docid]
+
+            # Validated items hold dataclass instances,
+            # constructed items keep deserialized dicts
+            trusted_docids = typeCast(List[Dict[str, Any]], trusted.docid)
+            self.assertIsInstance(found.docid[0], DocID)
+            self.assertIsInstance(trusted_docids[0], dict)
+
+            self.assertEqual(
+                [docid['id'] for docid in trusted_docids],
+                [docid.id for docid in found.docid])
+            self.assertEqual(
+                [
+                    title['content'] for title in
+                    typeCast(List[Dict[str, Any]], trusted.title)
+                ],
+                [
+                    title.content for title in
+                    typeCast(List[Title], found.title)
+                ])
+
+            self.assertEqual(trusted.sources.keys(), found.sources.keys())
+            for sourced_id, source in trusted.sources.items():
+                source_docids = typeCast(
+                    List[Dict[str, Any]],
+                    source.bibitem.docid)
+                self.assertIsNone(source.validation_errors)
+                self.assertIsInstance(source_docids[0], dict)
+                self.assertEqual(
+                    [docid['id'] for docid in source_docids],
+                    [
+                        docid.id for docid in
+                        found.sources[sourced_id].bibitem.docid
+                    ])
+
     def test_build_search_empty_results(self):
         """
         Test that build_search_results returns an empty list of
@@ -1,9 +1,12 @@
 from typing import Dict
 from unittest import TestCase
 
+from django.db.utils import DataError, ProgrammingError
+
 from bib_models import DocID
 from bib_models.util import get_primary_docid
 from main.query_utils import get_docid_struct_for_search
+from main.query_utils import is_benign_user_input_error
 
 
 class QueryTestCase(TestCase):
@@ -52,3 +55,30 @@ class QueryTestCase(TestCase):
             DocID(id="id3", type="type3", scope="scope", primary=False)
         ]
         self.assertIsNone(get_primary_docid(raw_ids))
+
+    def test_get_primary_docid_returns_first_of_several(self):
+        """
+        get_primary_docid should return the first eligible primary docid
+        if there is more than one
+        """
+        raw_ids = [
+            DocID(id="id1", type="type1", scope="scope", primary=True),
+            DocID(id="id2", type="type2", primary=True),
+            DocID(id="id3", type="type3", primary=True),
+        ]
+        primary_id = get_primary_docid(raw_ids)
+        self.assertIsNotNone(primary_id)
+        self.assertEqual(primary_id.id, "id2")  # type: ignore
+
+    def test_is_benign_user_input_error(self):
+        self.assertTrue(is_benign_user_input_error(DataError(
+            'invalid regular expression: parentheses () not balanced')))
+        self.assertTrue(is_benign_user_input_error(ProgrammingError(
+            'syntax error at or near ")" of jsonpath input')))
+        self.assertTrue(is_benign_user_input_error(ProgrammingError(
+            'unexpected end of quoted string at or near """ '
+            'of jsonpath input')))
+        self.assertFalse(is_benign_user_input_error(ProgrammingError(
+            'syntax error at or near "SELECT"')))
+        self.assertFalse(is_benign_user_input_error(ProgrammingError(
+            'relation "main_refdata" does not exist')))
@@ -222,6 +222,9 @@ class CitationSearchResultListView(MultipleObjectTemplateResponseMixin,
     template_name = 'browse/search_citations.html'
     metric_counter = metrics.gui_search_hits
 
+    trust_indexed_data = True
+    """Templates render found items whether or not they were validated."""
+
     def get_context_data(self, **kwargs):
         return dict(
             **super().get_context_data(**kwargs),